@@ -1,6 +1,6 @@
 from datetime import date
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Tuple
 from uuid import UUID
 from beanbot.common.configs import BeanbotConfig
 import pandas as pd
@@ -39,10 +39,7 @@ def get_entries_container(file: str) -> MutableEntriesContainer:
 #     return editor._adapter.get_dataframe(), editor._adapter.get_data_editor_kwargs()
 
 
-@st.cache_resource
-def get_adapter(
-    _entries: MutableEntriesContainer, filters: Optional[Dict] = None
-) -> StreamlitDataEditorAdapter:
+def make_adapter(entries: MutableEntriesContainer) -> StreamlitDataEditorAdapter:
     print("Creating adapter from entries")
 
     ext_new_predictions = extractor.DirectiveNewPredictionsExtractor()
@@ -51,7 +48,7 @@ def get_adapter(
     ext_cat_account = extractor.DirectiveCategoryAccountExtractor()
     ext_cat_amount = extractor.DirectiveCategoryAmountExtractor()
 
-    _entries.attach_extractors(
+    entries.attach_extractors(
         {
             "new_predictions": ext_new_predictions,
             "descriptions": ext_descriptions,
@@ -62,7 +59,7 @@ def get_adapter(
     )
 
     return StreamlitDataEditorAdapter(
-        _entries,
+        entries,
         [
             ColumnConfig("date", "Date", date, "The date of the transaction."),
             ColumnConfig(
@@ -97,11 +94,33 @@ def get_adapter(
 
 
 @st.cache_resource
-def get_dataframe(_adapter, filters: Optional[Dict] = None) -> pd.DataFrame:
+def get_adapter(_entries: MutableEntriesContainer) -> StreamlitDataEditorAdapter:
+    return make_adapter(_entries)
+
+
+@st.cache_resource
+def get_dataframe(_adapter) -> pd.DataFrame:
     print("Getting dataframe from adapter")
     return _adapter.get_dataframe()
 
 
+# Filtered views are cached separately, keyed by the filtered entry ids, so that they can be
+# dropped after an edit while the unfiltered adapter and dataframe are patched in place
+@st.cache_resource
+def get_filtered_adapter(
+    _entries: MutableEntriesContainer, filters: Dict, entry_ids: Tuple[UUID, ...]
+) -> StreamlitDataEditorAdapter:
+    return make_adapter(_entries)
+
+
+@st.cache_resource
+def get_filtered_dataframe(
+    _adapter, filters: Dict, entry_ids: Tuple[UUID, ...]
+) -> pd.DataFrame:
+    print("Getting filtered dataframe from adapter")
+    return _adapter.get_dataframe()
+
+
 def is_new_prediction(entry: directive.MutableTransaction) -> bool:
     return isinstance(entry, directive.MutableTransaction) and is_predicted(entry)
 
@@ -117,6 +136,7 @@ entries_container = get_entries_container(TEST_FILE)
 # entries = entries_orig.filter(is_new_prediction)
 adapter = get_adapter(entries_container)
 dataframe = get_dataframe(adapter)
+base_adapter = adapter
 
 
 filters = {}
@@ -143,13 +163,14 @@ with st.expander("Filters"):
 
 
 def filter_dataframe(dataframe: pd.DataFrame, filters: Dict[str, str]) -> List[UUID]:
-    df_temp = dataframe.copy()
+    # Combine the column-wise substring matches into a single mask instead of
+    # copying and re-filtering the dataframe for every column
+    mask = pd.Series(True, index=dataframe.index)
     for column, filter in filters.items():
-        f = lambda x: filter in str(x)
-        df_temp = df_temp[df_temp[column].apply(f)]
-        if len(df_temp) == 0:
+        mask &= dataframe[column].map(str).str.contains(filter, regex=False)
+        if not mask.any():
             return []
-    return df_temp["entry_id"].tolist()
+    return dataframe.loc[mask, "entry_id"].tolist()
 
 
 if len(filters) > 0:
@@ -158,19 +179,23 @@ if len(filters) > 0:
         filters,
     )
     filtered_entries = entries_container.filter_by_id(filtered_rows)
-    adapter = get_adapter(filtered_entries, filters)
-    dataframe = get_dataframe(adapter, filters)
+    adapter = get_filtered_adapter(filtered_entries, filters, tuple(filtered_rows))
+    dataframe = get_filtered_dataframe(adapter, filters, tuple(filtered_rows))
 
 # Show the table editor
 st.data_editor(dataframe, **adapter.get_data_editor_kwargs())
 
 # Button for confirming the changes
 if st.button("Confim Changes"):
-    adapter.update_entries()
-    get_adapter.clear()
-    get_dataframe.clear()
-    # st.session_state[adapter._editor_key] = {}
-    # print(st.session_state)
+    # Patch the unfiltered dataframe in place instead of rebuilding it from all entries, but
+    # rebuild the filtered views, as the edit may change which entries match a filter
+    edited_ids = adapter.update_entries()
+    if adapter is not base_adapter:
+        base_adapter.refresh_rows(edited_ids)
+        base_adapter.reset_editor_state()
+    get_filtered_adapter.clear()
+    get_filtered_dataframe.clear()
+    st.rerun()
 
 
 if st.button("Save To File"):
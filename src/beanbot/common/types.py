@@ -13,7 +13,7 @@ Postings = List[Posting]
 VectorizedTransactions = namedtuple(
     "VectorizedTransactions",
     [
-        "vec",  # np.ndarray (n_transaction, n_dim): int
+        "vec",  # np.ndarray or scipy.sparse.csr_matrix (n_transaction, n_dim)
         "label",  # np.ndarray (n_transaction,): int
         "learnable",  # np.ndarray (n_transaction,): bool
     ],
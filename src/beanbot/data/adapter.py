@@ -1,7 +1,8 @@
 import datetime
+import threading
 from typing import Any, Dict, List, Optional, OrderedDict, Callable
 from types import NoneType
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from pandas import DataFrame
 from beanbot.data.directive import MutableTransaction
@@ -78,6 +79,9 @@ class StreamlitDataEditorAdapter:
         self._editor_key = str(uuid4())[-8:]
         self._editor_state = {}
         self._editor_row_to_id = {}
+        self._editor_id_to_row = {}
+        self._dataframe = None
+        self._update_lock = threading.Lock()
         self._refresh_needed = False
 
     def is_refresh_needed(self) -> bool:
@@ -88,25 +92,57 @@ class StreamlitDataEditorAdapter:
         # key as the argument, and through st.session_state the change can be accessed as e.g.:
         # {'edited_rows': {0: {'new_predictions': True}}, 'added_rows': [], 'deleted_rows': []}
         def update_editor_state(editor_key):
-            self._editor_state = st.session_state[editor_key]
+            with self._update_lock:
+                self._editor_state = st.session_state[editor_key]
             print(f"[DEBUG] Editor state: {self._editor_state}")
             # edited_rows = st.session_state[key]["edited_rows"]
 
         return update_editor_state
 
     def get_dataframe(self) -> DataFrame:
+        columns = self.get_visible_columns()
+        if "entry_id" not in columns:
+            columns.append("entry_id")  # add id field for easier queries
         bb_entries_df = self._bb_entries.as_dataframe(
             selected_entry_type=MutableTransaction,
-            selected_columns=self.get_visible_columns()
-            + ["entry_id"],  # add id field for easier queries
+            selected_columns=columns,
         )
         # bb_entries_df.insert(0, "Select", False, allow_duplicates=False)
         self._editor_row_to_id = {
             idx: row.entry_id for idx, row in bb_entries_df.iterrows()
         }
+        self._editor_id_to_row = {
+            entry_id: idx for idx, entry_id in self._editor_row_to_id.items()
+        }
+        self._dataframe = bb_entries_df
 
         return bb_entries_df
 
+    def refresh_rows(self, entry_ids: List[UUID]) -> None:
+        """Patch the rows of the given entries in the dataframe returned by `get_dataframe`, in place.
+
+        This keeps the dataframe in sync with the entries after an edit, without rebuilding it from all entries.
+        Entries not shown by this adapter are ignored.
+        """
+        if self._dataframe is None:
+            return
+        columns = list(self._dataframe.columns)
+        for entry_id in entry_ids:
+            row = self._editor_id_to_row.get(entry_id)
+            if row is None:
+                continue
+            entry_dict = self._bb_entries.get_entry_as_dict_by_id(entry_id, columns)
+            for col, value in entry_dict.items():
+                self._dataframe.at[row, col] = value
+
+    def reset_editor_state(self) -> None:
+        """Drop the edits accumulated by the streamlit editor, e.g. after they were applied to the entries.
+
+        The editor key is rotated, so that streamlit creates a fresh editor widget on the next run.
+        """
+        self._editor_key = str(uuid4())[-8:]
+        self._editor_state = {}
+
     def get_visible_columns(self) -> List[str]:
         return [c.id for c in self._column_configs.values()]
 
@@ -173,30 +209,50 @@ class StreamlitDataEditorAdapter:
             height=600,
         )
 
-    def update_entries(self):
-        """Update the mutable entries' fields based on the editor state."""
-        edited_rows = self._editor_state.get("edited_rows", {})
-
-        for row, row_changes in edited_rows.items():
-            entry_id = self._editor_row_to_id[row]
-            for col, col_change in row_changes.items():
-                if self._column_configs[col].linked_entry_field is not None:
-                    col_config = self._column_configs[col]
-                    # entry_id = idx_to_id[row]
-
-                    if col_config.entry_setter_fn is not None:
-                        orig_value = getattr(
-                            self._bb_entries.get_entry_by_id(entry_id),
-                            col_config.linked_entry_field,
-                        )
-                        upd_value = col_config.entry_setter_fn(orig_value, col_change)
-                    else:
-                        upd_value = col_change
+    def update_entries(self) -> List[UUID]:
+        """Update the mutable entries' fields based on the editor state, and patch the edited rows of the dataframe.
 
-                    self._bb_entries.edit_entry_by_id(
-                        entry_id,
-                        keys=[col_config.linked_entry_field],
-                        values=[upd_value],
-                    )
+        The editor state is consumed and reset, so that the same edits are not applied again on the next update.
+        If a setter raises, the rows edited so far are still patched before the error is propagated.
 
-        self._refresh_needed = True
+        Returns:
+            List[UUID]: ids of the edited entries.
+        """
+        edited_ids = []
+
+        # The editor state accumulates all edits since the editor was created, and the editor callback
+        # may fire concurrently, so hold the lock until the state has been applied and reset
+        with self._update_lock:
+            edited_rows = self._editor_state.get("edited_rows", {})
+            try:
+                for row, row_changes in edited_rows.items():
+                    entry_id = self._editor_row_to_id[row]
+                    for col, col_change in row_changes.items():
+                        col_config = self._column_configs[col]
+                        if col_config.linked_entry_field is None:
+                            continue
+
+                        if col_config.entry_setter_fn is not None:
+                            orig_value = getattr(
+                                self._bb_entries.get_entry_by_id(entry_id),
+                                col_config.linked_entry_field,
+                            )
+                            upd_value = col_config.entry_setter_fn(
+                                orig_value, col_change
+                            )
+                        else:
+                            upd_value = col_change
+
+                        self._bb_entries.edit_entry_by_id(
+                            entry_id,
+                            keys=[col_config.linked_entry_field],
+                            values=[upd_value],
+                        )
+                        if not edited_ids or edited_ids[-1] != entry_id:
+                            edited_ids.append(entry_id)
+            finally:
+                self.refresh_rows(edited_ids)
+                self.reset_editor_state()
+                self._refresh_needed = True
+
+        return edited_ids
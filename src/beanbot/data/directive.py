@@ -12,10 +12,11 @@ _MAP_TO_IMMUTABLE_DIRECTIVE = {}
 def _from_immutable(cls: type, obj: bd.Directive) -> "MutableDirective":
     """patched method to recursively convert an immutable object to its mutable counterpart"""
     cls_mutable = _MAP_TO_MUTABLE_DIRECTIVE[cls]
-    fields_dict = dict()
-    for key, value in obj._asdict().items():
+    values = []
+    # Iterate the fields in order and construct positionally, avoiding the intermediate dicts
+    for value in obj:
         if type(value) in _MAP_TO_MUTABLE_DIRECTIVE:
-            fields_dict[key] = _from_immutable(type(value), value)
+            value = _from_immutable(type(value), value)
         elif isinstance(value, list):
             value = [
                 v
@@ -23,29 +24,25 @@ def _from_immutable(cls: type, obj: bd.Directive) -> "MutableDirective":
                 else _from_immutable(type(v), v)
                 for v in value
             ]
-            fields_dict[key] = value
-        else:
-            fields_dict[key] = value
-    return cls_mutable(**fields_dict)
+        values.append(value)
+    return cls_mutable(*values)
 
 
 def _to_immutable(obj: "MutableDirective") -> bd.Directive:
     """patched method to recursively convert a mutable object to its immutable counterpart"""
     cls = type(obj)
     cls_immutable = _MAP_TO_IMMUTABLE_DIRECTIVE[cls]
-    fields_dict = dict()
-    for key, value in obj._asdict().items():
+    values = []
+    for value in obj:
         if type(value) in _MAP_TO_IMMUTABLE_DIRECTIVE:
-            fields_dict[key] = _to_immutable(value)
+            value = _to_immutable(value)
         elif isinstance(value, list):
             value = [
                 v if type(v) not in _MAP_TO_IMMUTABLE_DIRECTIVE else _to_immutable(v)
                 for v in value
             ]
-            fields_dict[key] = value
-        else:
-            fields_dict[key] = value
-    return cls_immutable(**fields_dict)
+        values.append(value)
+    return cls_immutable(*values)
 
 
 def _make_mutable_type(immutable_type: type) -> type:
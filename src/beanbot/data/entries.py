@@ -9,6 +9,7 @@ from beancount.loader import load_file
 from pandas import DataFrame
 
 from beanbot.data.directive import (
+    ALL_MUTABLE_DIRECTIVES,
     MutableDirective,
     MutableEntries,
     MutableOpen,
@@ -20,6 +21,15 @@ from beanbot.file.text_editor import ChangeSet, ChangeType, TextEditor
 from beanbot.ops.extractor import BaseExtractor
 
 
+def _make_entry_ids(n: int) -> List[uuid.UUID]:
+    """Generate `n` random (version 4) UUIDs, reading the randomness for all of them at once."""
+    random_bytes = os.urandom(16 * n)
+    return [
+        uuid.UUID(bytes=random_bytes[offset : offset + 16], version=4)
+        for offset in range(0, 16 * n, 16)
+    ]
+
+
 class MutableEntriesContainer:
     """Class for managing the view of mutable entries accompanied with methods for conveniently modifying them."""
 
@@ -33,6 +43,7 @@ class MutableEntriesContainer:
         extra_extractors: Dict[str, BaseExtractor] = None,
         metadata: Optional[List] = None,
         opened_accounts: Optional[Set[str]] = None,
+        edited_entry_ids: Optional[Set[uuid.UUID]] = None,
     ) -> None:
         """Create a collection of beancount entries.
 
@@ -43,10 +54,12 @@ class MutableEntriesContainer:
             options_map (Dict): Dictionary of options that were set in the beancount file.
             extra_extractors (Dict[str, BaseExtractor], optional): Dictionary of extractors that should be used to extract
                 metadata from the entries.
+            edited_entry_ids (Set[uuid.UUID], optional): Ids of the edited entries. Views created from a container share
+                this set with it, so that edits made through either of them are tracked in one place.
         """
 
         assert all(
-            [isinstance(entry, MutableDirective) for entry in entries]
+            isinstance(entry, ALL_MUTABLE_DIRECTIVES) for entry in entries
         ), "All entries should be mutable directives."
 
         self._entries = entries
@@ -61,16 +74,24 @@ class MutableEntriesContainer:
         else:  # create new metadata with entry ids
             self._metadata = [
                 {
-                    "entry_id": uuid.uuid4(),
+                    "entry_id": entry_id,
                     self._BEANBOT_EDITED_FLAG: False,
                 }
-                for _ in range(len(entries))
+                for entry_id in _make_entry_ids(len(entries))
             ]
             self._extract_entry_lineno_range()
         if opened_accounts is not None:
             self._opened_accounts = opened_accounts
         else:
             self._opened_accounts = self._extract_opened_accounts()
+        if edited_entry_ids is not None:
+            self._edited_entry_ids = edited_entry_ids
+        else:
+            self._edited_entry_ids = {
+                metadata["entry_id"]
+                for metadata in self._metadata
+                if metadata.get(self._BEANBOT_EDITED_FLAG, False)
+            }
 
         self._id_to_idx = {
             self._metadata[idx]["entry_id"]: idx for idx in range(len(entries))
@@ -88,6 +109,8 @@ class MutableEntriesContainer:
         return MutableEntriesContainer(entries, errors, options_map)
 
     def save(self) -> None:
+        if not self.has_edits():
+            return
         changesets = self._get_changesets()
         for filename, changes in changesets.items():
             print(f"Saving changes to {filename}:")
@@ -100,20 +123,26 @@ class MutableEntriesContainer:
     def _get_changesets(self, add_newline: bool = True) -> Dict[str, List[ChangeSet]]:
         file_changesets = defaultdict(list)
         eprinter = EntryPrinter()
-        for entry, metadata in zip(self._entries, self._metadata):
-            if metadata[self._BEANBOT_EDITED_FLAG]:
-                filename = os.path.realpath(entry.meta["filename"])
-                lineno_range = metadata["lineno_range"]
-                entry_string = eprinter(entry.to_immutable())
-                if add_newline:
-                    entry_string += "\n"
-                file_changesets[filename].append(
-                    ChangeSet(
-                        type=ChangeType.REPLACE,
-                        position=lineno_range,
-                        content=[entry_string],
-                    )
+        # Only visit the edited entries, in their original order
+        edited_indices = sorted(
+            self._id_to_idx[entry_id]
+            for entry_id in self._edited_entry_ids
+            if entry_id in self._id_to_idx
+        )
+        for idx in edited_indices:
+            entry = self._entries[idx]
+            filename = os.path.realpath(entry.meta["filename"])
+            lineno_range = self._metadata[idx]["lineno_range"]
+            entry_string = eprinter(entry.to_immutable())
+            if add_newline:
+                entry_string += "\n"
+            file_changesets[filename].append(
+                ChangeSet(
+                    type=ChangeType.REPLACE,
+                    position=lineno_range,
+                    content=[entry_string],
                 )
+            )
         return file_changesets
 
     def _extract_entry_lineno_range(self) -> None:
@@ -121,23 +150,21 @@ class MutableEntriesContainer:
 
         file_linenos = defaultdict(list)
         entries = self._entries
+        # resolve every file path only once, it is reused for the ranges below
+        filenames = [os.path.realpath(entry.meta["filename"]) for entry in entries]
 
-        for entry in entries:
-            filename = os.path.realpath(entry.meta["filename"])
-            lineno = entry.meta["lineno"]
-            file_linenos[filename].append(lineno)
+        for filename, entry in zip(filenames, entries):
+            file_linenos[filename].append(entry.meta["lineno"])
 
-        for filename in file_linenos:
-            file_linenos[filename].sort()
+        for linenos in file_linenos.values():
+            linenos.sort()
 
-        next_linenos = defaultdict(dict)
-        for filename, linenos in file_linenos.items():
-            for idx in range(len(linenos) - 1):
-                next_linenos[filename][linenos[idx]] = linenos[idx + 1]
-            next_linenos[filename][linenos[-1]] = 0
+        next_linenos = {
+            filename: dict(zip(linenos, linenos[1:] + [0]))
+            for filename, linenos in file_linenos.items()
+        }
 
-        for idx, entry in enumerate(entries):
-            filename = os.path.realpath(entry.meta["filename"])
+        for idx, (filename, entry) in enumerate(zip(filenames, entries)):
             lineno = entry.meta["lineno"]
             # the linenos from beancount entries are 1-indexed
             self._metadata[idx]["lineno_range"] = (
@@ -154,6 +181,11 @@ class MutableEntriesContainer:
             entry_dict = {key: entry_dict[key] for key in selected_keys}
         return entry_dict
 
+    def get_entry_as_dict_by_id(
+        self, entry_id: uuid.UUID, selected_keys: Optional[List] = None
+    ) -> Dict:
+        return self.get_entry_as_dict(self._id_to_idx[entry_id], selected_keys)
+
     def get_entry_by_idx(self, idx: int) -> MutableDirective:
         entry = self._entries[idx]
         return entry
@@ -173,13 +205,17 @@ class MutableEntriesContainer:
         return set(self.as_dataframe(entry_type, [key]).unique())
 
     def _extract_opened_accounts(self) -> Set[str]:
-        return set(
-            [entry.account for entry in self._entries if isinstance(entry, MutableOpen)]
-        )
+        return {
+            entry.account for entry in self._entries if isinstance(entry, MutableOpen)
+        }
 
     def get_opened_accounts(self) -> Set[str]:
         return self._opened_accounts
 
+    def has_edits(self) -> bool:
+        """Check whether any entry of this container has been edited, in time proportional to the number of edits."""
+        return any(entry_id in self._id_to_idx for entry_id in self._edited_entry_ids)
+
     # Conversions
 
     def as_dataframe(
@@ -216,6 +252,7 @@ class MutableEntriesContainer:
     def edit_entry_by_idx(self, idx: int, keys: List[str], values: List):
         directive = self._entries[idx]
         self._metadata[idx][self._BEANBOT_EDITED_FLAG] = True
+        self._edited_entry_ids.add(self._metadata[idx]["entry_id"])
         for key, value in zip(keys, values):
             value_type = type(getattr(directive, key))
             assert value_type == type(
@@ -291,6 +328,7 @@ class MutableEntriesContainer:
             self._attached_extractors,
             selected_metadata,
             self._opened_accounts,
+            self._edited_entry_ids,
         )
 
     # Filtering rows
@@ -37,6 +37,7 @@ Primitives = str | int | float | bool | NoneType
 _MAGIC_STR_SER_OBJ = "___serialized_obj___"
 _MAGIC_STR_SER_LIST = "___serialized_list___"
 _MAGIC_STR_SER_DICT = "___serialized_dict___"
+_MAGIC_STRS = frozenset((_MAGIC_STR_SER_OBJ, _MAGIC_STR_SER_LIST, _MAGIC_STR_SER_DICT))
 
 
 _DEFAULT_FN_SERIALIZE = {
@@ -80,7 +81,8 @@ def _is_serialized_tuple(obj: object) -> bool:
     return (
         isinstance(obj, (tuple, list))
         and len(obj) == 3
-        and obj[0] in [_MAGIC_STR_SER_DICT, _MAGIC_STR_SER_LIST, _MAGIC_STR_SER_OBJ]
+        and isinstance(obj[0], str)
+        and obj[0] in _MAGIC_STRS
     )
 
 
@@ -2,6 +2,7 @@
 
 """This module implements the Filer class which is responsible for saving / appending each new transactions into the corresponding files."""
 
+import io
 import sys
 from typing import Dict
 from collections import defaultdict
@@ -58,11 +59,15 @@ class EntryFileSaver:
     ):
         """Save a list of `Transaction`s into `filename`"""
 
+        # Render everything into memory first so that the file is written in one go
+        buffer = io.StringIO()
+        printer.print_entries(transactions, file=buffer)
+
         if dryrun:
             print(
                 f"*************************************\n[Dryrun] The following transactions will be saved to\n{filename}\n*************************************"
             )
-            printer.print_entries(transactions, file=sys.stdout)
+            sys.stdout.write(buffer.getvalue())
         else:
             with open(filename, "a") as file:
-                printer.print_entries(transactions, file=file)
+                file.write(buffer.getvalue())
@@ -3,10 +3,11 @@
 
 from dataclasses import dataclass
 import enum
+import os
 from math import inf
 from pathlib import Path
 from types import NoneType
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 
 class ChangeType(enum.Enum):
@@ -16,7 +17,7 @@ class ChangeType(enum.Enum):
     APPEND = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeSet:
     """
     Represents a change set that describes a modification to a text file.
@@ -86,20 +87,43 @@ class TextEditor:
         Raises:
             AssertionError: If the file does not exist.
         """
-        self._file_path = Path(file_path)
+        self._init_state(self._read_file(file_path, encoding), file_path, encoding)
+        assert self._file_path.exists(), f"File {file_path} does not exist."
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        file_path: Optional[str] = None,
+        encoding: str = "utf-8",
+    ) -> "TextEditor":
+        """
+        Create a TextEditor from already loaded lines, skipping the file read.
+
+        Args:
+            lines (Iterable[str]): The lines of the file, with their line endings.
+            file_path (Optional[str]): The default path used by `save_changes()`.
+
+        Returns:
+            TextEditor: The editor over a copy of the given lines.
+        """
+        editor = cls.__new__(cls)
+        editor._init_state(lines, file_path, encoding)
+        return editor
+
+    def _init_state(
+        self, lines: Iterable[str], file_path: Optional[str], encoding: str
+    ) -> None:
+        self._file_path = Path(file_path) if file_path is not None else None
         self._encoding = encoding
-        self._lines = self._read_file(file_path)
+        # note: we add this empty line to be able to address the position after the last line with -1
+        self._lines = [*lines, ""]
         self._file_n_lines = len(self._lines)
-        assert self._file_path.exists(), f"File {file_path} does not exist."
         self._changes = []
 
-    def _read_file(self, file_path: str) -> List[str]:
-        with open(file_path, "r", encoding=self._encoding) as file:
-            lines = file.readlines()
-        lines.append(
-            ""
-        )  # note: we add this empty line to be able to address the position after the last line with -1
-        return lines
+    def _read_file(self, file_path: str, encoding: str) -> List[str]:
+        with open(file_path, "r", encoding=encoding) as file:
+            return file.readlines()
 
     def edit(self, changes: List[ChangeSet] | ChangeSet) -> None:
         """
@@ -131,13 +155,18 @@ class TextEditor:
 
         return pos_tuple
 
-    def _sort_changes_by_position(self):
-        self._changes.sort(key=self._get_position_tuple)
+    def _sort_changes_by_position(self) -> List[Tuple[int, int]]:
+        """Sort the changes by position and return their absolute positions in the same order.
+        The positions are resolved once here, so that later checks and edits can reuse them."""
+        positions = [self._get_position_tuple(change) for change in self._changes]
+        order = sorted(range(len(positions)), key=positions.__getitem__)
+        self._changes = [self._changes[idx] for idx in order]
+        return [positions[idx] for idx in order]
 
-    def _check_changes_non_overlapping(self):
+    def _check_changes_non_overlapping(self, positions: List[Tuple[int, int]]):
         for idx in range(len(self._changes) - 1):
-            edit_begin, edit_end = self._get_position_tuple(self._changes[idx])
-            next_begin, next_end = self._get_position_tuple(self._changes[idx + 1])
+            edit_begin, edit_end = positions[idx]
+            next_begin, next_end = positions[idx + 1]
             assert (
                 not edit_begin <= next_begin < edit_end
             ), f"Changes {self._changes[idx]} and {self._changes[idx + 1]} are overlapping."
@@ -147,29 +176,25 @@ class TextEditor:
                     not next_begin == next_end == edit_begin
                 ), f"Double insertion at position {edit_begin} detected."
 
-    def _check_range_validity(self, line_count: int):
-        for change in self._changes:
-            position = self._get_position_tuple(change)
+    def _check_range_validity(self, positions: List[Tuple[int, int]], line_count: int):
+        for change, position in zip(self._changes, positions):
             assert position == (inf, inf) or (
                 0 <= position[0] <= position[1] < line_count
             ), f"Change {change} is invalid."
 
-    def save_changes(self, to_path: Optional[str] = None):
+    def get_edited_lines(self) -> List[str]:
         """
-        Saves the changes made to the file.
-
-        Args:
-            to_path (Optional[str]): The path to save the file. If not provided, the changes will be saved to the original file path.
+        Applies the changes to the file content without writing it back.
 
         Returns:
-            None
+            List[str]: The lines of the edited file, with their line endings.
         """
 
         lines = self._lines
 
-        self._sort_changes_by_position()
-        self._check_changes_non_overlapping()
-        self._check_range_validity(len(lines))
+        positions = self._sort_changes_by_position()
+        self._check_changes_non_overlapping(positions)
+        self._check_range_validity(positions, len(lines))
 
         edited_lines = []
 
@@ -180,16 +205,14 @@ class TextEditor:
         ):  # ignore the last empty line added when reading
             # No more changes to apply
             if change_idx >= len(self._changes):
-                edited_lines.extend(lines[line_idx:])
+                edited_lines.extend(lines[line_idx:-1])
                 break
 
-            change_begin, change_end = self._get_position_tuple(
-                self._changes[change_idx]
-            )
+            change_begin, change_end = positions[change_idx]
 
             # Next change is append
             if change_begin == inf:
-                edited_lines.extend(lines[line_idx:])
+                edited_lines.extend(lines[line_idx:-1])
                 edited_lines.extend(self._changes[change_idx].content)
                 break
 
@@ -220,6 +243,20 @@ class TextEditor:
             else:
                 assert False, f"Unexpected change type {self._changes[change_idx].type}"
 
+        return edited_lines
+
+    def save_changes(self, to_path: Optional[str | os.PathLike] = None):
+        """
+        Saves the changes made to the file.
+
+        Args:
+            to_path (Optional[str | os.PathLike]): The path to save the file. If not provided, the changes will be saved to the original file path.
+
+        Returns:
+            None
+        """
+        edited_lines = self.get_edited_lines()
         save_path = to_path if to_path is not None else self._file_path
+        assert save_path is not None, "No path to save the file to."
         with open(save_path, "w", encoding=self._encoding) as file:
             file.writelines(edited_lines)
@@ -8,13 +8,24 @@ logger = logging.getLogger(__name__)
 # Set the logging level
 logger.setLevel(logging.INFO)
 
+# Records are written by the handlers below; don't hand them to the root logger as well
+logger.propagate = False
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that only creates the log directory and file when the first record is emitted."""
+
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
 # Create a file handler
 log_file = f'logs/beanbot_{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.log'
-if not os.path.exists("logs"):
-    os.makedirs("logs")
-file_handler = logging.FileHandler(
-    f'logs/beanbot_{datetime.now().strftime("%Y-%m-%d_%H-%M-%S")}.log'
-)
+file_handler = _LazyFileHandler(log_file)
 
 # Create a stream handler
 stream_handler = logging.StreamHandler()
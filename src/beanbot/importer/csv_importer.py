@@ -1,4 +1,5 @@
 import csv
+from operator import attrgetter
 from re import Match
 from typing import List, Optional
 
@@ -135,7 +136,7 @@ class CSVImporter(importer.ImporterProtocol):
                 *body_entries,
                 *footer_entries,
             ],
-            key=lambda x: getattr(x, "date"),
+            key=attrgetter("date"),
         )
 
         return entries
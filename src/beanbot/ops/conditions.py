@@ -1,6 +1,5 @@
 from decimal import Decimal
 from typing import Dict, Optional
-import regex as re
 from beancount.core.data import Transaction, Posting
 from beancount.core.inventory import Inventory
 from beancount.core import interpolate, number
@@ -23,7 +22,7 @@ def is_balanced(transaction: Transaction, options_map: Dict) -> bool:
     """Test and return if `transaction` is balanced"""
 
     # First test if transaction contains floating posting to absorb residuals
-    balanced = any([is_residual_posting(posting) for posting in transaction.postings])
+    balanced = any(is_residual_posting(posting) for posting in transaction.postings)
     residual = Inventory()
     # If not, calculate residuals explicitly
     if not balanced:
@@ -37,7 +36,7 @@ def is_balanced(transaction: Transaction, options_map: Dict) -> bool:
 def is_predicted(transaction: Transaction) -> bool:
     """If transaction has tag started with `_new`, treat it as a predicted transaction."""
 
-    return any(map(lambda tag: re.match(r"_new", tag), transaction.tags))
+    return any(tag.startswith("_new") for tag in transaction.tags)
 
 
 def is_internal_transfer(
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from operator import attrgetter
 from typing import Any, Optional, Tuple, List
 from beancount.core.data import (
     iter_entry_dates,
@@ -40,7 +41,7 @@ class BaseDeduplicator(object):
         window_tail = datetime.timedelta(days=window_days_tail + 1)
 
         entries = deepcopy(entries)
-        entries = sorted(entries, key=lambda x: x.date)
+        entries = sorted(entries, key=attrgetter("date"))
 
         # For each of the new entries, look at existing entries at a nearby date.
         duplicates = []
@@ -64,8 +65,10 @@ class BaseDeduplicator(object):
             entries, imported_entries, self._window_days_head, self._window_days_tail
         )
         duplicated_entries = [pair[1] for pair in duplicated_pairs]
+        # Entries are unhashable (they hold lists and dicts), so look them up by identity
+        duplicated_ids = {id(entry) for entry in duplicated_entries}
         non_duplicated_entries = [
-            entry for entry in imported_entries if entry not in duplicated_entries
+            entry for entry in imported_entries if id(entry) not in duplicated_ids
         ]
 
         return duplicated_entries, non_duplicated_entries
@@ -78,6 +81,9 @@ class InternalTransferDeduplicator(BaseDeduplicator):
         super().__init__(window_days_head, window_days_tail)
         self._max_date_difference = max_date_difference
         self._re_internal_account = re.compile(r"^(Liabilities:Credit|Assets:Checking)")
+        self._extract_source_account = (
+            TransactionRecordSourceAccountExtractor().extract_one
+        )
 
     def _is_internal_transfer(
         self, entry: Transaction, imported_entry: Transaction, max_date_difference: int
@@ -86,9 +92,14 @@ class InternalTransferDeduplicator(BaseDeduplicator):
             len(imported_entry.postings) == 1
         ), "Imported entry must have exactly one posting for deduplication"
 
-        source_account_extr = TransactionRecordSourceAccountExtractor()
-        account_entry = source_account_extr.extract_one(entry)
-        account_imported_entry = source_account_extr.extract_one(imported_entry)
+        # Check the date difference first, as it is much cheaper than extracting the accounts
+        date1 = entry.date
+        date2 = imported_entry.date
+        if abs(date1 - date2) > datetime.timedelta(days=max_date_difference):
+            return False
+
+        account_entry = self._extract_source_account(entry)
+        account_imported_entry = self._extract_source_account(imported_entry)
 
         if not self._re_internal_account.match(
             account_entry
@@ -97,11 +108,6 @@ class InternalTransferDeduplicator(BaseDeduplicator):
         # TODO: attempt adding the destination account to the postings
 
         # Check if any two postings from entry and imported entry can form a balanced transaction
-        date1 = entry.date
-        date2 = imported_entry.date
-        if abs(date1 - date2) > datetime.timedelta(days=max_date_difference):
-            return False
-
         duplicate_found = False
 
         for posting in entry.postings:
@@ -174,11 +180,24 @@ def _comparator(field_value_0: Any, field_value_1: Any, field_key: str) -> bool:
 
 
 class SimilarEntryDeduplicator(BaseDeduplicator):
+    _FIELDS_COMPARISON = {
+        Open: ("date", "account"),
+        Close: ("date", "account"),
+        Balance: ("date", "account", "amount"),
+        Transaction: ("date", "payee", "narration", "postings"),
+        Note: ("date", "account", "comment"),
+    }
+    _FIELD_GETTERS = {
+        entry_type: attrgetter(*fields)
+        for entry_type, fields in _FIELDS_COMPARISON.items()
+    }
+    _OPTIONAL_STRING_FIELDS = frozenset(("payee", "narration", "comment"))
+
     def _compare_postings(
         self, postings: Postings, imported_postings: Postings
     ) -> bool:
-        postings = sorted(postings.copy(), key=lambda x: x.account)
-        imported_postings = sorted(imported_postings.copy(), key=lambda x: x.account)
+        postings = sorted(postings, key=attrgetter("account"))
+        imported_postings = sorted(imported_postings, key=attrgetter("account"))
 
         accounts = [posting.account for posting in postings]
         accounts_imported = [posting.account for posting in imported_postings]
@@ -212,26 +231,19 @@ class SimilarEntryDeduplicator(BaseDeduplicator):
         if type(entry) != type(imported_entry):  # pylint: disable=unidiomatic-typecheck
             return False
 
-        FIELDS_COMPARISON = {
-            Open: ["date", "account"],
-            Close: ["date", "account"],
-            Balance: ["date", "account", "amount"],
-            Transaction: ["date", "payee", "narration", "postings"],
-            Note: ["date", "account", "comment"],
-        }
-
         assert (
-            type(entry) in FIELDS_COMPARISON.keys()
+            type(entry) in self._FIELDS_COMPARISON
         ), "Entry type not supported for deduplication"
 
-        fields = FIELDS_COMPARISON[type(entry)]
-        for field in fields:
-            field_value_0 = getattr(entry, field, None)
-            field_value_1 = getattr(imported_entry, field, None)
+        fields = self._FIELDS_COMPARISON[type(entry)]
+        get_fields = self._FIELD_GETTERS[type(entry)]
+        for field, field_value_0, field_value_1 in zip(
+            fields, get_fields(entry), get_fields(imported_entry)
+        ):
             if field == "postings":
                 if not self._compare_postings(field_value_0, field_value_1):
                     return False
-            elif field in ["payee", "narration", "comment"]:
+            elif field in self._OPTIONAL_STRING_FIELDS:
                 if not self._compare_optional_strings(field_value_0, field_value_1):
                     return False
             else:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from datetime import date
+from functools import cache, lru_cache
 import logging
 import numpy as np
 from beancount.core.data import Transaction, Directive, Entries
@@ -10,7 +11,7 @@ from beanbot.data import directive
 import regex as re
 from beanbot.common.configs import BeanbotConfig
 from beanbot.common.types import Postings
-from typing import List
+from typing import List, Tuple
 
 
 class BaseExtractor(object):
@@ -21,7 +22,8 @@ class BaseExtractor(object):
         return self._extract_one_impl(entry)
 
     def extract(self, entries: Entries) -> List:
-        return [self.extract_one(e) for e in entries]
+        extract_one = self.extract_one  # bind once, not for every entry
+        return [extract_one(e) for e in entries]
 
     def _extract_one_impl(self, entry: Directive):
         return NotImplementedError("You need to implement this method in the subclass.")
@@ -37,18 +39,34 @@ class BaseExtractor(object):
             AssertionError: If the type of the entry is not compatible with the expected type.
         """
 
-        expected_type_str = re.match(
-            r"[A-Z](?:[a-z]+|[A-Z]*(?=[A-Z]|$))", self.__class__.__name__
-        ).group()
-        expected_type_immutable = getattr(data, expected_type_str)
-        expected_type_mutable = getattr(directive, "Mutable" + expected_type_str)
+        expected_type_str, expected_types = _get_expected_entry_types(self.__class__)
         assert isinstance(
-            entry, (expected_type_immutable, expected_type_mutable)
+            entry, expected_types
         ), f"Expected type {expected_type_str}, got {type(entry)}!"
 
 
+@cache
+def _get_expected_entry_types(extractor_cls: type) -> Tuple[str, Tuple[type, type]]:
+    """Resolve the (immutable, mutable) entry types expected by an extractor class.
+    The result only depends on the class name, so it is computed once per class."""
+
+    expected_type_str = re.match(
+        r"[A-Z](?:[a-z]+|[A-Z]*(?=[A-Z]|$))", extractor_cls.__name__
+    ).group()
+    expected_type_immutable = getattr(data, expected_type_str)
+    expected_type_mutable = getattr(directive, "Mutable" + expected_type_str)
+    return expected_type_str, (expected_type_immutable, expected_type_mutable)
+
+
 ################# Extractor for Transactions #################
 
+# Patterns used for normalizing descriptions, compiled once at import
+_sub_abbreviation_dots = re.compile(r"((?<=(\P{L}|^)\p{L})\.(?=\p{L}(\P{L}|$)))+").sub
+_sub_symbols_whitespaces = re.compile(r"(\p{Z}|\p{S}|\p{P})+").sub
+_EUROPEAN_CHARS_TRANSLATION = str.maketrans(
+    {"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss", "é": "e"}
+)
+
 
 class TransactionDescriptionExtractor(BaseExtractor):
     """Extract descriptions from transactions"""
@@ -78,27 +96,29 @@ class TransactionDescriptionExtractor(BaseExtractor):
         # result = re.sub(r'(?<=\w)\.(?=\w)', '', result)
 
         # remove dots in form of abbreviations e.g. a.b.c.d
-        result = re.sub(r"((?<=(\P{L}|^)\p{L})\.(?=\p{L}(\P{L}|$)))+", "", result)
+        result = _sub_abbreviation_dots("", result)
 
         # normalize remaining symbols & whitespaces
-        result = re.sub(r"(\p{Z}|\p{S}|\p{P})+", " ", result)
+        result = _sub_symbols_whitespaces(" ", result)
 
         # normalization: replace european texts with english ones
-        result = result.replace("ä", "ae")
-        result = result.replace("ö", "oe")
-        result = result.replace("ü", "ue")
-        result = result.replace("ß", "ss")
-        result = result.replace("é", "e")
+        result = result.translate(_EUROPEAN_CHARS_TRANSLATION)
 
         return result
 
 
+@lru_cache(maxsize=128)
+def _compile_regexp(regexp: str) -> re.Pattern:
+    """Compile the account patterns once and share them between extractor instances."""
+    return re.compile(regexp)
+
+
 class _TransactionRegExpExtractor(BaseExtractor):
     """Extract description from Transaction using RegExp with an extra helper method `match`."""
 
     def __init__(self, regexp: str):
         super().__init__()
-        self._regexp = re.compile(regexp)
+        self._regexp = _compile_regexp(regexp)
 
     def match(self, string: str):
         return self._regexp.match(string)
@@ -206,12 +226,8 @@ class TransactionNewPredictionsExtractor(BaseExtractor):
     """Extract the classifier state from the transaction"""
 
     def _extract_one_impl(self, entry: Transaction) -> bool:
-        if entry.tags is None:
-            return False
-        for tag in entry.tags:
-            if tag.startswith("_new"):
-                return True
-        return False
+        tags = entry.tags
+        return tags is not None and any(tag.startswith("_new") for tag in tags)
 
 
 ################# Extractor for Balances #################
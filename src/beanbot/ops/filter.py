@@ -31,13 +31,11 @@ class BaseFilter:
         return self._filter_impl(entries)
 
     def _filter_impl(self, entries: data.Entries) -> data.Entries:
-        return [entry for entry in entries if self._test_condition(entry)]
-
-    def _test_condition(self, entry: data.Directive) -> bool:
-        condition = self._cond_impl(entry)
+        # Resolve the condition once per call instead of once per entry
+        condition = self._cond_impl
         if self._inverse_condition:
-            condition = not condition
-        return condition
+            return [entry for entry in entries if not condition(entry)]
+        return [entry for entry in entries if condition(entry)]
 
     def _cond_impl(self, entry: data.Directive) -> bool:
         return True
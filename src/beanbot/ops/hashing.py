@@ -14,7 +14,9 @@ class BiDirectionalHash(object):
 
     def hash(self, obj: Union[Any, Iterable[Any]]) -> Union[int, np.ndarray]:
         if isinstance(obj, Iterable):
-            return np.array([self._hash_impl(o) for o in obj])
+            # Fill the integer array directly instead of going through an intermediate list
+            hash_impl = self._hash_impl
+            return np.fromiter((hash_impl(o) for o in obj), dtype=int)
         return self._hash_impl(obj)
 
     def _hash_impl(self, obj: Any) -> int:
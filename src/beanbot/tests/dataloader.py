@@ -3,7 +3,7 @@
 
 """Module for loading test cases for the classifier."""
 
-from copy import deepcopy
+from itertools import pairwise
 from typing import List, Tuple, Iterable, Optional
 import random
 from beancount.loader import load_file
@@ -51,7 +51,7 @@ class DataLoader:
         return (entries, errors, options_map)
 
     def _remove_entries_tail(
-        self, transactions: Transactions
+        self, transactions: Transactions, category_accounts: List[str]
     ) -> Tuple[Transactions, List[int]]:
         """Remove the ground truth label from the `n_removal` last entries"""
 
@@ -60,30 +60,36 @@ class DataLoader:
             range(len(transactions) - n_removal, len(transactions))
         )
 
-        return self._remove_entries(transactions, indices_to_remove)
+        return self._remove_entries(transactions, category_accounts, indices_to_remove)
 
     def _remove_entries_rand(
-        self, transactions: Transactions, random_seed: int
+        self,
+        transactions: Transactions,
+        category_accounts: List[str],
+        random_seed: int,
     ) -> Tuple[Transactions, List[int]]:
         """Remove randomly the ground truth label from `n_removal` entries"""
 
-        random.seed(random_seed)
+        rng = random.Random(random_seed)
         n_removal = int(self._ratio_removal * len(transactions))
-        indices_to_remove = random.sample(range(len(transactions)), n_removal)
+        indices_to_remove = rng.sample(range(len(transactions)), n_removal)
 
-        return self._remove_entries(transactions, indices_to_remove)
+        return self._remove_entries(transactions, category_accounts, indices_to_remove)
 
     def _remove_entries(
-        self, transactions: Transactions, indices: List[int]
+        self,
+        transactions: Transactions,
+        category_accounts: List[str],
+        indices: List[int],
     ) -> Tuple[Transactions, List[int]]:
         """Remove the ground truth label from entries with indices in `indices`.
+        `category_accounts` holds the category account of each transaction, as returned by the extractor.
 
         Returns:
             transactions: The transactions with the removed labels,
             removed_incides_successful: The indices of the entries that were successfully removed.
         """
 
-        category_accounts = TransactionCategoryAccountExtractor().extract(transactions)
         valid_labels = [
             (idx, account)
             for idx, account in enumerate(category_accounts)
@@ -95,20 +101,27 @@ class DataLoader:
             n_valid_labels >= len(indices)
         ), f"You cannot remove more than {n_valid_labels} entries from the ground truth transaction list!"
 
-        transactions = deepcopy(transactions)
+        # Only the transactions losing a posting are rebuilt, the others are shared with the ground truth
+        transactions = list(transactions)
         removed_labels = zip(indices, [category_accounts[idx] for idx in indices])
         removed_indices_successful = []
         for idx_transaction, account_to_remove in removed_labels:
-            # account_found = False
-            for idx_posting, posting in enumerate(
-                transactions[idx_transaction].postings
-            ):
-                if posting.account == account_to_remove:
-                    transactions[idx_transaction].postings.pop(idx_posting)
-                    # account_found = True
-                    removed_indices_successful.append(idx_transaction)
-                    break
-            # assert account_found, ("Category account not found!")
+            transaction = transactions[idx_transaction]
+            postings = transaction.postings
+            idx_posting = next(
+                (
+                    idx
+                    for idx, posting in enumerate(postings)
+                    if posting.account == account_to_remove
+                ),
+                None,
+            )
+            if idx_posting is None:
+                continue
+            transactions[idx_transaction] = transaction._replace(
+                postings=postings[:idx_posting] + postings[idx_posting + 1 :]
+            )
+            removed_indices_successful.append(idx_transaction)
 
         return transactions, removed_indices_successful
 
@@ -117,17 +130,20 @@ class DataLoader:
 
         all_entries, _, options_map = self._load_test_file()
         transactions_gt = filter.TransactionFilter().filter(all_entries)
+        category_accounts_gt = TransactionCategoryAccountExtractor().extract(
+            transactions_gt
+        )
 
         if self._remove_from_tail:
             transactions_input, removed_indices = self._remove_entries_tail(
-                transactions_gt
+                transactions_gt, category_accounts_gt
             )
         else:
             assert (
                 self._init_rand_seed is not None
             ), "You must provide a random seed for the random removal of transactions!"
             transactions_input, removed_indices = self._remove_entries_rand(
-                transactions_gt, self._init_rand_seed
+                transactions_gt, category_accounts_gt, self._init_rand_seed
             )
 
         yield Dataset(
@@ -136,9 +152,10 @@ class DataLoader:
             input_transactions=transactions_input,
             removed_indices=removed_indices,
             all_entries=all_entries,
+            gt_category_accounts=category_accounts_gt,
         )
 
     def _safeguard_date_ascending(self, entries):
         assert all(
-            [entries[i].date <= entries[i + 1].date for i in range(len(entries) - 1)]
+            entry.date <= entry_next.date for entry, entry_next in pairwise(entries)
         ), "Dates are not ascending!"
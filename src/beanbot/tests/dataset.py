@@ -7,7 +7,7 @@ from beanbot.common.types import Transactions
 from beancount.core.data import Entries
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Dataset(object):
     """Class for storing a dataset
 
@@ -18,6 +18,7 @@ class Dataset(object):
         removed_indices (List[int]): Indices for the removed entries
         pred_transactions (Optional[Transactions], optional): Predicted transactions. Defaults to None.
         all_entries (Optional[Entries], optional): All entries returned by the loader. Defaults to None.
+        gt_category_accounts (Optional[List[str]], optional): Category accounts of the ground truth transactions. Defaults to None.
     """
 
     gt_transactions: Transactions
@@ -26,3 +27,4 @@ class Dataset(object):
     removed_indices: List[int]
     pred_transactions: Optional[Transactions] = None
     all_entries: Optional[Entries] = None
+    gt_category_accounts: Optional[List[str]] = None
@@ -3,6 +3,8 @@
 """Module containing various metrics"""
 
 from abc import ABC, abstractclassmethod
+from dataclasses import fields
+import os
 import numpy as np
 from beanbot.tests.dataset import Dataset
 from beanbot.ops.extractor import (
@@ -10,19 +12,21 @@ from beanbot.ops.extractor import (
     TransactionDescriptionExtractor,
 )
 
-from pandas import DataFrame
+
+# Fields of `Dataset` that are only a cache and may be left unset
+_OPTIONAL_FIELDS = frozenset({"gt_category_accounts"})
 
 
 class AbstractMetrics(ABC):
     @classmethod
     def calculate(cls, dataset: Dataset):
         """Calculate metrics on `dataset`. Assumes all fields have valid value."""
-        for attr in dir(dataset):
-            if callable(getattr(dataset, attr)) or attr.startswith("__"):
+        for field in fields(dataset):
+            if field.name in _OPTIONAL_FIELDS:
                 continue
             assert (
-                getattr(dataset, attr) is not None
-            ), f"Dataset incomplete. Missing field {attr}"
+                getattr(dataset, field.name) is not None
+            ), f"Dataset incomplete. Missing field {field.name}"
 
         print(f"Calculating metrics on {len(dataset.removed_indices)} transactions.")
         return cls._metrics_impl(dataset)
@@ -32,54 +36,66 @@ class AbstractMetrics(ABC):
         raise NotImplementedError()
 
 
+def _replace_empty(values: np.ndarray) -> np.ndarray:
+    """Replace the empty strings of an object array for printing."""
+    return np.where(values == "", "(empty)", values)
+
+
 class PrecisionScore(AbstractMetrics):
     """Calculate the precision score: TP / (TP + FP)"""
 
     @classmethod
     def _metrics_impl(cls, dataset: Dataset) -> float:
-        account_extractor = TransactionCategoryAccountExtractor()
-        pred_accounts = account_extractor.extract(dataset.pred_transactions)
-        gt_accounts = account_extractor.extract(dataset.gt_transactions)
-
-        n_transactions = len(pred_accounts)
-        assert n_transactions == len(gt_accounts)
+        n_transactions = len(dataset.pred_transactions)
+        assert n_transactions == len(dataset.gt_transactions)
 
-        masks = np.zeros(n_transactions)
-        masks[dataset.removed_indices] = 1.0
-        good_predictions = np.array(
-            [(gt == pred) for (gt, pred) in zip(gt_accounts, pred_accounts)]
+        # Only the transactions with removed labels are evaluated, so extract and compare just those
+        removed_indices = np.asarray(dataset.removed_indices, dtype=int)
+        account_extractor = TransactionCategoryAccountExtractor()
+        pred_accounts = account_extractor.extract(
+            [dataset.pred_transactions[idx] for idx in removed_indices]
         )
-        idx_bad_predictions = (1 - good_predictions).nonzero()[0]
+        if dataset.gt_category_accounts is not None:
+            gt_accounts = [dataset.gt_category_accounts[idx] for idx in removed_indices]
+        else:
+            gt_accounts = account_extractor.extract(
+                [dataset.gt_transactions[idx] for idx in removed_indices]
+            )
+
+        pred_accounts = np.asarray(pred_accounts, dtype=object)
+        gt_accounts = np.asarray(gt_accounts, dtype=object)
+        good_predictions = gt_accounts == pred_accounts
+        bad_positions = np.flatnonzero(~good_predictions)
 
         # Print bad cases
-        if len(idx_bad_predictions) > 0:
+        if len(bad_positions) > 0:
             print("Bad cases discovered!")
+            # pandas is slow to import and only needed for reporting the bad cases
+            from pandas import DataFrame
+
+            # Only materialize the bad rows, keyed by their index in the dataset
+            idx_bad_predictions = removed_indices[bad_positions]
+            pred_bad = [dataset.pred_transactions[idx] for idx in idx_bad_predictions]
             descriptions = TransactionDescriptionExtractor().extract(
-                dataset.input_transactions
+                [dataset.input_transactions[idx] for idx in idx_bad_predictions]
             )
 
-            replace_empty = lambda s: "(empty)" if s == "" else s
             transactions_table = {
-                "date": [replace_empty(t.date) for t in dataset.pred_transactions],
+                "date": [t.date for t in pred_bad],
                 "description": [
-                    replace_empty(d.replace("\n", "").replace("\r", ""))
+                    d.replace("\n", "").replace("\r", "") or "(empty)"
                     for d in descriptions
                 ],
-                "prediction": [replace_empty(a) for a in pred_accounts],
-                "groundtruth": [replace_empty(a) for a in gt_accounts],
-                "tags": [replace_empty(t.tags) for t in dataset.pred_transactions],
-                "is_bad": [i in idx_bad_predictions for i in range(n_transactions)],
+                "prediction": _replace_empty(pred_accounts[bad_positions]),
+                "groundtruth": _replace_empty(gt_accounts[bad_positions]),
+                "tags": [t.tags or "(empty)" for t in pred_bad],
             }
 
-            transactions_df = DataFrame(transactions_table)
-            transactions_df.to_csv("bad_cases.csv")
-
-            transactions_bad = transactions_df[transactions_df.is_bad == True]  # noqa: E712
+            transactions_bad = DataFrame(transactions_table, index=idx_bad_predictions)
+            if os.environ.get("BEANBOT_DUMP_BAD_CASES"):
+                transactions_bad.to_csv("bad_cases.csv")
             print(transactions_bad)
 
-        # Only calculate matrix on masked elements
-        n_good_predictions = np.sum(good_predictions * masks)
-        n_predictions = np.sum(masks)
-        precision = float(n_good_predictions) / n_predictions
+        precision = float(good_predictions.mean())
 
         return precision
@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 import logging
 from typing import List
 from beanbot.common.configs import BeanbotConfig
@@ -18,10 +19,14 @@ def _setter_fn_new_prediction(old_tags: set, col_change: bool) -> set:
     Returns:
         new_tags (set): the new tags for the transaction"""
     if col_change:  # change to new
-        tags = old_tags.union({"_new_"})
-    else:
-        tags = {t for t in old_tags if "_new_" not in t}
-    return frozenset(tags)
+        return frozenset((*old_tags, "_new_"))
+    return frozenset(t for t in old_tags if "_new_" not in t)
+
+
+@lru_cache(maxsize=8)
+def _compile_category_regexp(regex_category_account: str) -> re.Pattern:
+    """Compile the category account pattern once instead of on every edit. Keyed by the pattern, so config changes are picked up."""
+    return re.compile(regex_category_account)
 
 
 def _setter_fn_pred_account(
@@ -34,12 +39,12 @@ def _setter_fn_pred_account(
     Returns:
         new_postings (List[MutablePosting]): the new postings for the transaction"""
 
-    # dirty: refactor this part
-    regex_category_account = BeanbotConfig.get_global()["regex-category-account"]
-    regexp = re.compile(regex_category_account)
+    match_category = _compile_category_regexp(
+        BeanbotConfig.get_global()["regex-category-account"]
+    ).match
 
     for posting in old_postings:
-        if regexp.match(posting.account):
+        if match_category(posting.account):
             logging.debug(f"Set account from {posting.account} to {col_change}")
             posting.account = col_change
             return old_postings  # return by reference
@@ -49,68 +54,60 @@ def _setter_fn_pred_account(
     )
 
 
+_EXTRACTOR_FACTORIES = {
+    "new_predictions": extractor.DirectiveNewPredictionsExtractor,
+    "descriptions": extractor.DirectiveDescriptionExtractor,
+    "source_account": extractor.DirectiveRecordSourceAccountExtractor,
+    "category_account": extractor.DirectiveCategoryAccountExtractor,
+    "category_amount": extractor.DirectiveCategoryAmountExtractor,
+}
+
+_COLUMN_CONFIGS = (
+    ColumnConfig("date", "Date", datetime.date, "The date of the transaction."),
+    ColumnConfig(
+        "category_account",
+        "Category",
+        OpenedAccount,
+        "The transaction category.",
+        linked_entry_field="postings",
+        editable=True,
+        entry_setter_fn=_setter_fn_pred_account,
+    ),
+    ColumnConfig("category_amount", "Amount", float, "The transaction amount."),
+    ColumnConfig("payee", "Payee", str, "The transaction payee"),
+    ColumnConfig("narration", "Narration", str, "The transaction narration."),
+    ColumnConfig(
+        "new_predictions",
+        "New Prediction",
+        bool,
+        "Is the transaction category newly predicted?",
+        linked_entry_field="tags",
+        editable=True,
+        entry_setter_fn=_setter_fn_new_prediction,
+    ),
+    ColumnConfig(
+        "source_account",
+        "Booked On",
+        str,
+        "Which account is the tranaction booked on?",
+    ),
+    ColumnConfig(
+        "entry_id",
+        "Entry ID",
+        str,
+        "The unique identifier of the transaction used for editing.",
+    ),
+)
+
+
 class BeanbotDataEditorFactory:
     def __init__(self, entries: MutableEntriesContainer) -> None:
         self._bb_entries = entries
 
-        ext_new_predictions = extractor.DirectiveNewPredictionsExtractor()
-        ext_descriptions = extractor.DirectiveDescriptionExtractor()
-        ext_source_account = extractor.DirectiveRecordSourceAccountExtractor()
-        ext_cat_account = extractor.DirectiveCategoryAccountExtractor()
-        ext_cat_amount = extractor.DirectiveCategoryAmountExtractor()
-
         self._bb_entries.attach_extractors(
-            {
-                "new_predictions": ext_new_predictions,
-                "descriptions": ext_descriptions,
-                "source_account": ext_source_account,
-                "category_account": ext_cat_account,
-                "category_amount": ext_cat_amount,
-            }
+            {key: factory() for key, factory in _EXTRACTOR_FACTORIES.items()}
         )
 
         self._adapter = StreamlitDataEditorAdapter(
-            self._bb_entries,
-            [
-                ColumnConfig(
-                    "date", "Date", datetime.date, "The date of the transaction."
-                ),
-                ColumnConfig(
-                    "category_account",
-                    "Category",
-                    OpenedAccount,
-                    "The transaction category.",
-                    linked_entry_field="postings",
-                    editable=True,
-                    entry_setter_fn=_setter_fn_pred_account,
-                ),
-                ColumnConfig(
-                    "category_amount", "Amount", float, "The transaction amount."
-                ),
-                ColumnConfig("payee", "Payee", str, "The transaction payee"),
-                ColumnConfig(
-                    "narration", "Narration", str, "The transaction narration."
-                ),
-                ColumnConfig(
-                    "new_predictions",
-                    "New Prediction",
-                    bool,
-                    "Is the transaction category newly predicted?",
-                    linked_entry_field="tags",
-                    editable=True,
-                    entry_setter_fn=_setter_fn_new_prediction,
-                ),
-                ColumnConfig(
-                    "source_account",
-                    "Booked On",
-                    str,
-                    "Which account is the tranaction booked on?",
-                ),
-                ColumnConfig(
-                    "entry_id",
-                    "Entry ID",
-                    str,
-                    "The unique identifier of the transaction used for editing.",
-                ),
-            ],
+            self._bb_entries, list(_COLUMN_CONFIGS)
         )
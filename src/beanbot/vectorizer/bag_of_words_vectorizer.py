@@ -43,19 +43,18 @@ class BagOfWordVectorizer(AbstractVectorizer):
 
     def vectorize(self, transactions: Transactions) -> VectorizedTransactions:
         assert self._is_trained, "You need to train the CountVectorizer first with the `fit_dictionary` method!"
-        learnable_mask = np.ones(
-            (
-                len(
-                    transactions,
-                )
-            ),
-            dtype=bool,
-        )
-
         trans_desc = self._trans_desc_extractor.extract(transactions)
-        trans_desc_vec = self._vectorizer.transform(trans_desc).toarray()
+        # Transactions from the same payee often share a description, so only transform the unique ones
+        unique_desc_indices = {}
+        desc_indices = [
+            unique_desc_indices.setdefault(desc, len(unique_desc_indices))
+            for desc in trans_desc
+        ]
+        # Keep the (mostly zero) tf-idf matrix sparse, the classifiers accept CSR input
+        trans_desc_vec = self._vectorizer.transform(list(unique_desc_indices))
+        trans_desc_vec = trans_desc_vec[desc_indices]
         # If a text corpus contains no word in the dictionary, the vectorizer will return an all-zero vector. We mark this as not learnable
-        learnable_mask &= trans_desc_vec.sum(-1) != 0
+        learnable_mask = trans_desc_vec.getnnz(axis=1) != 0
 
         # if self._date_extractor is not None:
         #     date_vec = np.array(self._date_extractor.extract(transactions))[:, None]
@@ -67,10 +66,16 @@ class BagOfWordVectorizer(AbstractVectorizer):
 
         cat_accounts = self._cat_account_extractor.extract(transactions)
         cat_accounts_ind = self._bd_hash.hash(cat_accounts)
-        learnable_mask &= cat_accounts_ind != 0
+        np.logical_and(learnable_mask, cat_accounts_ind != 0, out=learnable_mask)
 
         return VectorizedTransactions(trans_desc_vec, cat_accounts_ind, learnable_mask)
 
+    @property
+    def feature_dim(self) -> int:
+        """Number of columns of the vectors returned by `vectorize()`, fixed once the dictionary is fitted"""
+        assert self._is_trained, "You need to train the CountVectorizer first with the `fit_dictionary` method!"
+        return len(self._vectorizer.vocabulary_)
+
     def devectorize_label(self, label: Iterable[int]) -> Account:
         return self._bd_hash.dehash(label)
 
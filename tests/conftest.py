@@ -0,0 +1,12 @@
+import pytest
+
+from beancount.loader import load_file
+from beancount.core.data import Entries
+
+
+@pytest.fixture(scope="session")
+def bc_entries() -> Entries:
+    """Entries of the sample ledger, parsed once and shared by all tests. They are immutable, so sharing is safe."""
+    BEANCOUNT_FILE = "tests/data/main.bean"
+    entries, errors, options = load_file(BEANCOUNT_FILE)
+    return entries
@@ -14,20 +14,17 @@ def run_cli_command():
 
 def read_file_content(filepath):
     assert Path(filepath).exists(), f"File {filepath} does not exist."
-    with open(filepath, "r") as file:
-        content = file.readlines()
-    return content
+    return Path(filepath).read_text().splitlines()
 
 
-def compare_output(expected_file, actual_output):
-    expected_content = read_file_content(expected_file)
-    actual_content = actual_output.splitlines()
+def _strip_non_empty(lines):
+    return [line for line in (line.strip() for line in lines) if line]
 
-    # Ignore the first 4 rows
-    actual_content = actual_content[4:]
 
-    expected_content = [line.strip() for line in expected_content if line.strip()]
-    actual_content = [line.strip() for line in actual_content if line.strip()]
+def compare_output(expected_file, actual_output):
+    expected_content = _strip_non_empty(read_file_content(expected_file))
+    # Ignore the first 4 rows
+    actual_content = _strip_non_empty(actual_output.splitlines()[4:])
     assert (
         expected_content == actual_content
     ), "Output does not match the expected content."
@@ -0,0 +1,65 @@
+from dataclasses import replace
+
+import pytest
+
+from beanbot.common.configs import BeanbotConfig
+from beanbot.data.entries import MutableEntriesContainer
+from beanbot.ui.factory import BeanbotDataEditorFactory
+
+
+BEANCOUNT_FILE = "tests/data/main.bean"
+
+
+@pytest.fixture
+def adapter():
+    BeanbotConfig.get_global().parse_file(BEANCOUNT_FILE)
+    entries = MutableEntriesContainer.load_from_file(BEANCOUNT_FILE)
+    adapter = BeanbotDataEditorFactory(entries)._adapter
+    adapter.get_dataframe()
+    return adapter
+
+
+def test_update_entries_patches_dataframe_when_setter_fails(adapter):
+    def failing_setter(old_value, col_change):
+        raise ValueError("no category account")
+
+    adapter._column_configs["category_account"] = replace(
+        adapter._column_configs["category_account"], entry_setter_fn=failing_setter
+    )
+    dataframe = adapter.get_dataframe()
+    new_prediction = not dataframe.at[0, "new_predictions"]
+    adapter._editor_state = {
+        "edited_rows": {
+            0: {"new_predictions": new_prediction},
+            1: {"category_account": "Expenses:Others"},
+        }
+    }
+    editor_key = adapter._editor_key
+
+    with pytest.raises(ValueError):
+        adapter.update_entries()
+
+    # The edit applied before the failure is reflected in the dataframe, and the editor is reset
+    assert dataframe.at[0, "new_predictions"] == new_prediction
+    assert adapter._editor_state == {}
+    assert adapter._editor_key != editor_key
+
+
+def test_update_entries_patches_dataframe(adapter):
+    dataframe = adapter.get_dataframe()
+    new_prediction = not dataframe.at[0, "new_predictions"]
+    adapter._editor_state = {
+        "edited_rows": {
+            0: {"new_predictions": new_prediction},
+            2: {"category_account": "Expenses:Others"},
+        }
+    }
+
+    edited_ids = adapter.update_entries()
+
+    assert edited_ids == [dataframe.at[0, "entry_id"], dataframe.at[2, "entry_id"]]
+    assert dataframe.at[0, "new_predictions"] == new_prediction
+    assert dataframe.at[2, "category_account"] == "Expenses:Others"
+    # The patched rows match a dataframe rebuilt from the entries
+    rebuilt = adapter.get_dataframe()
+    assert rebuilt.loc[[0, 2]].equals(dataframe.loc[[0, 2]])
@@ -1,8 +1,9 @@
-from copy import deepcopy
+from dataclasses import replace
 from pathlib import Path
 from beanbot.common.configs import BeanbotConfig
 from beanbot.file.saver import EntryFileSaver
 from beanbot.tests.dataloader import DataLoader
+from beanbot.tests.dataset import Dataset
 from beanbot.tests.metrics import PrecisionScore
 from beanbot.vectorizer.bag_of_words_vectorizer import BagOfWordVectorizer
 
@@ -14,6 +15,11 @@ global_config.parse_file(str(Path(__file__).parent / "data" / "main.bean"))
 TEST_FILE_SAMPLE = global_config["main-file"]
 
 
+def _snapshot(transactions):
+    """Shallow snapshot of transactions with their postings and meta."""
+    return [(txn, tuple(txn.postings), dict(txn.meta)) for txn in transactions]
+
+
 def test_vectorizer():
     loader = DataLoader(TEST_FILE_SAMPLE, ratio_removal=0.3)
 
@@ -29,10 +35,7 @@ def test_vectorizer():
         print(f"Vec label shape: {vec_transactions.label.shape}")
         assert vec_transactions.label.shape[0] == len(transactions)
         print("Testing vector shape... ", end="")
-        assert (
-            vectorizer.vectorize([transactions[0]]).vec.shape[1]
-            == vec_transactions.vec.shape[1]
-        )
+        assert vectorizer.feature_dim == vec_transactions.vec.shape[1]
         print("passed")
 
 
@@ -43,7 +46,7 @@ def test_classifier():
         input_transactions = test_set.input_transactions
         options_map = test_set.options_map
 
-        input_transactions_safeguard = deepcopy(input_transactions)
+        input_transactions_safeguard = _snapshot(input_transactions)
 
         # classifier = DecisionTreeTransactionClassifier(options_map)
         classifier = MetaTransactionClassifier(options_map)
@@ -51,10 +54,29 @@ def test_classifier():
         fallback_txn_file = global_config["fallback-transaction-file"]
         file_saver = EntryFileSaver(default_location=fallback_txn_file)
         file_saver.learn_filename(input_transactions)
-        test_set.pred_transactions = classifier.train_predict(input_transactions)
+        test_set = replace(
+            test_set, pred_transactions=classifier.train_predict(input_transactions)
+        )
         assert (
-            input_transactions == input_transactions_safeguard
+            _snapshot(input_transactions) == input_transactions_safeguard
         ), "Classifier is not supposed to modify transactions in place!"
         file_saver.save(test_set.pred_transactions, dryrun=True)
         metrics_val = PrecisionScore.calculate(test_set)
         print(f"Precision: {metrics_val}")
+
+
+def test_precision_without_gt_category_accounts():
+    loader = DataLoader(TEST_FILE_SAMPLE, ratio_removal=0.3)
+
+    for test_set in loader.load():
+        # A dataset built without the cached ground-truth accounts, predicting the ground truth itself
+        dataset = Dataset(
+            test_set.gt_transactions,
+            test_set.options_map,
+            test_set.input_transactions,
+            test_set.removed_indices,
+            test_set.gt_transactions,
+            test_set.all_entries,
+        )
+        assert dataset.gt_category_accounts is None
+        assert PrecisionScore.calculate(dataset) == 1.0
@@ -1,18 +1,6 @@
-import pytest
-
-from beancount.loader import load_file
-from beancount.core.data import Entries
-
 from beanbot.data import directive
 
 
-@pytest.fixture
-def bc_entries() -> Entries:
-    BEANCOUNT_FILE = "tests/data/main.bean"
-    entries, errors, options = load_file(BEANCOUNT_FILE)
-    return entries
-
-
 def test_make_mutable(bc_entries):
     for ent in bc_entries:
         ent_mutable = directive.make_mutable(ent)
@@ -0,0 +1,46 @@
+from beanbot.data import entries as entries_module
+from beanbot.data.directive import MutableTransaction
+from beanbot.data.entries import MutableEntriesContainer
+
+
+BEANCOUNT_FILE = "tests/data/main.bean"
+
+
+def _transaction_indices(container: MutableEntriesContainer):
+    return [
+        idx
+        for idx, entry in enumerate(container.get_entries())
+        if isinstance(entry, MutableTransaction)
+    ]
+
+
+def test_edits_through_view_are_tracked():
+    container = MutableEntriesContainer.load_from_file(BEANCOUNT_FILE)
+    edited_idx, other_idx = _transaction_indices(container)[:2]
+    edited_id = container.get_entry_as_dict(edited_idx)["entry_id"]
+
+    view = container.filter_by_id([edited_id])
+    other_view = container.filter_by_index([other_idx])
+    assert not container.has_edits()
+
+    view.edit_entry_by_id(edited_id, keys=["narration"], values=["Edited narration"])
+
+    assert container.has_edits()
+    assert view.has_edits()
+    assert not other_view.has_edits()
+
+    changesets = container._get_changesets()
+    assert [len(changes) for changes in changesets.values()] == [1]
+    (change,) = next(iter(changesets.values()))
+    assert change.position == container._metadata[edited_idx]["lineno_range"]
+    assert "Edited narration" in change.content[0]
+
+
+def test_save_without_edits_is_noop(monkeypatch):
+    container = MutableEntriesContainer.load_from_file(BEANCOUNT_FILE)
+
+    def fail_on_open(*args, **kwargs):
+        raise AssertionError("save() should not open any file without edits")
+
+    monkeypatch.setattr(entries_module, "TextEditor", fail_on_open)
+    container.save()
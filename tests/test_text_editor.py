@@ -1,77 +1,44 @@
-import tempfile
+from functools import lru_cache
 from typing import List
-from pathlib import Path
-from beanbot.file.text_editor import TextEditor, ChangeSet, ChangeType
-
-
-class TestTextEditor:
-    def run_test_case(
-        self, input_file: str, expect_file: str, changes: List[ChangeSet]
-    ):
-        text_editor = TextEditor(input_file)
-        text_editor.edit(changes)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            save_path = str(Path(temp_dir) / "output.txt")
-            text_editor.save_changes(to_path=save_path)
 
-            with open(save_path, "r", encoding="utf-8") as file:
-                modified_content = file.readlines()
+import pytest
 
-            # Read the expected output file
-            with open(expect_file, "r", encoding="utf-8") as file:
-                expected_content = file.readlines()
-
-            # Assert that the modified content matches the expected content
-            assert modified_content == expected_content
+from beanbot.file.text_editor import TextEditor, ChangeSet, ChangeType
 
-    def test_insertion(self):
-        # Define the changes to be made
 
-        input_file = "tests/data/file_editor/test_file.txt"
-        expect_file = "tests/data/file_editor/test_insert_expect.txt"
+INPUT_FILE = "tests/data/file_editor/test_file.txt"
 
-        changes = [
+# (name, expect_file, changes) applied to INPUT_FILE
+CASES = [
+    (
+        "insertion",
+        "tests/data/file_editor/test_insert_expect.txt",
+        [
             ChangeSet(ChangeType.INSERT, position=0, content=["a0\n", "a1\n", "a2\n"]),
             ChangeSet(
                 ChangeType.INSERT, position=6, content=["a3\n", "a4\n", "a5\n", "\n"]
             ),
-        ]
-
-        self.run_test_case(input_file, expect_file, changes)
-
-    def test_deletion(self):
-        # Define the changes to be made
-
-        input_file = "tests/data/file_editor/test_file.txt"
-        expect_file = "tests/data/file_editor/test_delete_expect.txt"
-
-        changes = [
+        ],
+    ),
+    (
+        "deletion",
+        "tests/data/file_editor/test_delete_expect.txt",
+        [
             ChangeSet(ChangeType.DELETE, position=(0, 2)),
             ChangeSet(ChangeType.DELETE, position=(3, 5)),
-        ]
-
-        self.run_test_case(input_file, expect_file, changes)
-
-    def test_rel_deletion(self):
-        # Define the changes to be made
-
-        input_file = "tests/data/file_editor/test_file.txt"
-        expect_file = "tests/data/file_editor/test_rel_delete_expect.txt"
-
-        changes = [
+        ],
+    ),
+    (
+        "rel_deletion",
+        "tests/data/file_editor/test_rel_delete_expect.txt",
+        [
             ChangeSet(ChangeType.DELETE, position=(-2, -1)),
-        ]
-
-        self.run_test_case(input_file, expect_file, changes)
-
-    def test_replace(self):
-        # Define the changes to be made
-
-        input_file = "tests/data/file_editor/test_file.txt"
-        expect_file = "tests/data/file_editor/test_replace_expect.txt"
-
-        changes = [
+        ],
+    ),
+    (
+        "replace",
+        "tests/data/file_editor/test_replace_expect.txt",
+        [
             ChangeSet(
                 ChangeType.REPLACE, position=(0, 2), content=["a0\n", "a1\n", "a2\n"]
             ),
@@ -80,18 +47,66 @@ class TestTextEditor:
                 position=(3, 5),
                 content=["a3\n", "a4\n", "a5\n", "\n"],
             ),
-        ]
+        ],
+    ),
+    (
+        "append",
+        "tests/data/file_editor/test_append_expect.txt",
+        [
+            ChangeSet(ChangeType.APPEND, content=["a0\n", "a1\n", "a2\n"]),
+        ],
+    ),
+]
 
-        self.run_test_case(input_file, expect_file, changes)
 
-    def test_append(self):
-        # Define the changes to be made
+@lru_cache(maxsize=None)
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
 
-        input_file = "tests/data/file_editor/test_file.txt"
-        expect_file = "tests/data/file_editor/test_append_expect.txt"
 
-        changes = [
-            ChangeSet(ChangeType.APPEND, content=["a0\n", "a1\n", "a2\n"]),
-        ]
+@pytest.fixture(scope="module")
+def base_lines() -> tuple[str, ...]:
+    return tuple(_read_text(INPUT_FILE).splitlines(keepends=True))
+
+
+class TestTextEditor:
+    def run_test_case(
+        self, base_lines: tuple[str, ...], expect_file: str, changes: List[ChangeSet]
+    ):
+        text_editor = TextEditor.from_lines(base_lines)
+        text_editor.edit(changes)
+
+        modified_content = "".join(text_editor.get_edited_lines())
+
+        # Read the expected output file
+        expected_content = _read_text(expect_file)
+
+        # Assert that the modified content matches the expected content
+        assert modified_content == expected_content
+
+    @pytest.mark.parametrize(
+        "expect_file,changes",
+        [case[1:] for case in CASES],
+        ids=[case[0] for case in CASES],
+    )
+    def test_edit(
+        self, base_lines: tuple[str, ...], expect_file: str, changes: List[ChangeSet]
+    ):
+        self.run_test_case(base_lines, expect_file, changes)
+
+    def test_save_changes(self, tmp_path):
+        _, expect_file, changes = CASES[0]
+        text_editor = TextEditor(INPUT_FILE)
+        text_editor.edit(changes)
+
+        save_path = tmp_path / "output.txt"
+        text_editor.save_changes(to_path=save_path)
+
+        assert save_path.read_text(encoding="utf-8") == _read_text(expect_file)
 
-        self.run_test_case(input_file, expect_file, changes)
+    def test_from_lines_matches_file(self, base_lines: tuple[str, ...]):
+        assert (
+            TextEditor.from_lines(base_lines).get_edited_lines()
+            == TextEditor(INPUT_FILE).get_edited_lines()
+        )